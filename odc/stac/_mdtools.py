@@ -22,6 +22,7 @@ from typing import (
     Tuple,
     Union,
 )
+from urllib.parse import urlparse
 
 import pystac.asset
 import pystac.collection
@@ -72,32 +73,36 @@ ConversionConfig = Dict[str, Any]
 EPSG4326 = CRS("EPSG:4326")
 
 # Assets with these roles are ignored unless manually requested
-ROLES_THUMBNAIL = {"thumbnail", "overview"}
+ROLES_THUMBNAIL = frozenset({"thumbnail", "overview"})
 
 # Used to detect image assets when media_type is missing
-RASTER_FILE_EXTENSIONS = {
-    "tif",
-    "tiff",
-    "jpeg",
-    "jpg",
-    "jp2",
-    "img",
-    "hdf",
-    "nc",
-    "zarr",
-}
+RASTER_FILE_EXTENSIONS = frozenset(
+    {
+        "tif",
+        "tiff",
+        "jpeg",
+        "jpg",
+        "jp2",
+        "img",
+        "hdf",
+        "nc",
+        "zarr",
+    }
+)
 
 # image/* and these media-type are considered to be raster
-NON_IMAGE_RASTER_MEDIA_TYPES = {
-    "application/x-hdf",
-    "application/x-hdf5",
-    "application/hdf",
-    "application/hdf5",
-    "application/x-netcdf",
-    "application/netcdf",
-    "application/x-zarr",
-    "application/zarr",
-}
+NON_IMAGE_RASTER_MEDIA_TYPES = frozenset(
+    {
+        "application/x-hdf",
+        "application/x-hdf5",
+        "application/hdf",
+        "application/hdf5",
+        "application/x-netcdf",
+        "application/netcdf",
+        "application/x-zarr",
+        "application/zarr",
+    }
+)
 
 
 def _band_metadata_raw(asset: pystac.asset.Asset) -> List[RasterBand]:
@@ -208,7 +213,7 @@ def is_raster_data(asset: pystac.asset.Asset, check_proj: bool = False) -> bool:
         ):
             return False
 
-    roles: Set[str] = set(asset.roles or [])
+    roles: Sequence[str] = asset.roles or ()
 
     media_type = asset.media_type
     if media_type is None:
@@ -219,19 +224,21 @@ def is_raster_data(asset: pystac.asset.Asset, check_proj: bool = False) -> bool:
         if "metadata" in roles:
             return False
 
-        ext = asset.href.split(".")[-1].lower()
-        return ext in RASTER_FILE_EXTENSIONS
+        # ignore query string of signed urls: .../B01.tif?sig=...
+        #   but not for local paths where ? and # are valid characters
+        href = asset.href
+        if "://" in href:
+            href = urlparse(href).path
+        _, _, ext = href.rpartition(".")
+        return ext.lower() in RASTER_FILE_EXTENSIONS
 
-    media_type, *_ = media_type.split(";")
-    media_type = media_type.lower()
+    media_type = media_type.partition(";")[0].lower()
 
     if media_type.startswith("image/"):
         # Image:
         #    False -- when thumbnail
         #    True  -- otherwise
-        if any(r in roles for r in ROLES_THUMBNAIL):
-            return False
-        return True
+        return ROLES_THUMBNAIL.isdisjoint(roles)
 
     if media_type in NON_IMAGE_RASTER_MEDIA_TYPES:
         return True
@@ -341,7 +348,7 @@ def _group_geoboxes(
         return (-len(grids[geobox]), geobox_gsd(geobox))
 
     # locate default grid
-    g_default, *_ = sorted(grids, key=gbox_score)
+    g_default = min(grids, key=gbox_score)
 
     named_grids: Dict[str, GeoBox] = {}
     band2grid: Dict[str, str] = {}
@@ -374,7 +381,7 @@ def band2grid_from_gsd(assets: Dict[str, pystac.asset.Asset]) -> Dict[str, str]:
 
     # Default grid is one with largest number of bands
     # .. and lowest gsd when there is a tie
-    (_, default_gsd), *_ = sorted((-len(bands), gsd) for gsd, bands in grids.items())
+    _, default_gsd = min((-len(bands), gsd) for gsd, bands in grids.items())
     band2grid = {}
     for gsd, bands in grids.items():
         grid_name = "default" if gsd == default_gsd else f"g{gsd:g}"
@@ -531,9 +531,11 @@ def _group_items(
     assert len(items) == len(parsed)
 
     group_key = _resolve_groupby(groupby, lon=lon)
+    # group key is needed for sorting and then for grouping, compute it once
+    keys = [group_key(items[idx], parsed[idx], idx) for idx in range(len(parsed))]
 
     def _sorter(idx: int):
-        _group = group_key(items[idx], parsed[idx], idx)
+        _group = keys[idx]
 
         if preserve_original_order:
             # Sort by group_key but keeping original item order within each group
@@ -544,12 +546,7 @@ def _group_items(
 
     ii = sorted(range(len(parsed)), key=_sorter)
 
-    return [
-        list(group)
-        for _, group in itertools.groupby(
-            ii, lambda idx: group_key(items[idx], parsed[idx], idx)
-        )
-    ]
+    return [list(group) for _, group in itertools.groupby(ii, keys.__getitem__)]
 
 
 def _tiles(item: ParsedItem, gbt: GeoboxTiles) -> Iterator[Tuple[int, int]]:
@@ -564,11 +561,26 @@ def _tyx_bins(
     items: List[ParsedItem],
     gbt: GeoboxTiles,
 ) -> Iterator[Tuple[Tuple[int, int, int], List[int]]]:
+    # Items with the same set of native grids have the same footprint, so
+    # tiles are only computed once per unique set of grids. Footprint of items
+    # without a georeferenced grid comes from item geometry, can't share those.
+    _cache: Dict[Tuple[GeoBox, ...], List[Tuple[int, int]]] = {}
+
+    def _item_tiles(item: ParsedItem) -> List[Tuple[int, int]]:
+        gbx = item.geoboxes()
+        if not any(g.crs is not None for g in gbx):
+            return list(_tiles(item, gbt))
+        tiles = _cache.get(gbx, None)
+        if tiles is None:
+            tiles = list(_tiles(item, gbt))
+            _cache[gbx] = tiles
+        return tiles
+
     for t_idx, group in enumerate(grouped):
         _yx: Dict[Tuple[int, int], List[int]] = {}
 
         for item_idx in group:
-            for idx in _tiles(items[item_idx], gbt):
+            for idx in _item_tiles(items[item_idx]):
                 _yx.setdefault(idx, []).append(item_idx)
 
         yield from (((t_idx, *idx), ii_item) for idx, ii_item in _yx.items())
@@ -6,7 +6,6 @@ from time import sleep
 from typing import Any, Dict, Optional
 
 import click
-import distributed
 import rasterio.enums
 
 from odc.stac.bench import (
@@ -23,6 +22,19 @@ from odc.stac.bench import (
 RIO_RESAMPLING_NAMES = [it.name for it in rasterio.enums.Resampling]
 
 
+def _load_geojson(path: str) -> Dict[str, Any]:
+    """Read GeoJSON file, uses faster ``orjson`` parser when installed."""
+    # pylint: disable=import-outside-toplevel,no-member
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "rt", encoding="utf8") as src:
+            return json.load(src)
+
+    with open(path, "rb") as src:
+        return orjson.loads(src.read())
+
+
 @click.group("odc-stac-bench")
 def main():
     """Benchmarking tool for odc.stac."""
@@ -78,6 +90,8 @@ def prepare(sample_site: str, list_sample_sites: bool, from_file, overwrite):
 @click.option("--memory-limit", type=str, help="Configure worker memory limit")
 def _dask(n_workers, threads_per_worker, memory_limit):
     """Launch local Dask Cluster."""
+    import distributed  # pylint: disable=import-outside-toplevel
+
     client = distributed.Client(
         n_workers=n_workers,
         threads_per_worker=threads_per_worker,
@@ -175,8 +189,7 @@ def run(
     if not cfg.scenario:
         cfg.scenario = site.rsplit(".", 1)[0]
 
-    with open(site, "rt", encoding="utf8") as src:
-        site_geojson = json.load(src)
+    site_geojson = _load_geojson(site)
 
     print(f"Loaded: {len(site_geojson['features'])} STAC items from '{site}'")
 
@@ -188,6 +201,8 @@ def run(
     if show_config:
         return
 
+    import distributed  # pylint: disable=import-outside-toplevel
+
     print(f"Connecting to Dask Scheduler: {scheduler}")
     client = distributed.Client(scheduler)
 
@@ -197,7 +212,7 @@ def run(
     print("=" * 60)
 
     ts = datetime.now().strftime("%Y%m%dT%H%M%S.%f")
-    results_file = f"{cfg.scenario}_{ts}.pkl"
+    results_file = f"{cfg.scenario}_{ts}.json"
     print(f"Will write results to: {results_file}")
     _ = run_bench(xx, client, ntimes=ntimes, results_file=results_file)
     print("=" * 60)
@@ -206,7 +221,9 @@ def run(
 
 @main.command("report")
 @click.option(
-    "--matching", type=str, help="Supply glob pattern instead of individual .pkl files"
+    "--matching",
+    type=str,
+    help="Supply glob pattern instead of individual result files",
 )
 @click.option(
     "--output",
@@ -214,19 +231,19 @@ def run(
     help="File to write CSV data, if not supplied will write to stdout",
 )
 @click.argument(
-    "pkls", type=click.Path(exists=True, dir_okay=False, readable=True), nargs=-1
+    "results", type=click.Path(exists=True, dir_okay=False, readable=True), nargs=-1
 )
-def report(matching: str, output: str, pkls):
+def report(matching: str, output: str, results):
     """
     Collate results of multiple benchmark experiments.
 
-    Read pickle files produced by the `run` command and assemble
+    Read result files produced by the `run` command and assemble
     them into one CSV file.
     """
     if matching is not None:
         data_raw = load_results(matching)
     else:
-        data_raw = load_results(pkls)
+        data_raw = load_results(results)
 
     if output is None:
         print(data_raw.to_csv())
@@ -1,30 +1,42 @@
 """Helper methods for benchmark reporting."""
 
 import glob
+import json
 import pickle
-from typing import Any, Dict, Iterable, Iterator, Union
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
 
 import pandas as pd
 
+from ._run import BenchmarkContext, TimeSample
+
 # pylint: disable=unsupported-assignment-operation
 
 
+def _load_result(fname: str) -> Tuple[BenchmarkContext, List[TimeSample]]:
+    if fname.endswith(".pkl"):
+        # results from older versions of `odc-stac-bench run`
+        with open(fname, "rb") as src:
+            dd = pickle.load(src)
+        return dd["context"], dd["samples"]
+
+    with open(fname, "rt", encoding="utf8") as src:
+        dd = json.load(src)
+    return BenchmarkContext.from_dict(dd["context"]), [tuple(s) for s in dd["samples"]]
+
+
 def load_results(
     sources: Union[str, Iterable[str]],
 ) -> pd.DataFrame:
     """
     Load benchmark run results.
 
-    :param sources: A glob pattern or a stream of pickle file paths
+    :param sources: A glob pattern or a stream of result file paths (``.json`` or ``.pkl``)
     :return: Pandas dataframe
     """
 
     def _stream(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
         for idx, fname in enumerate(paths):
-            with open(fname, "rb") as src:
-                dd = pickle.load(src)
-            ctx = dd["context"]
-            samples = dd["samples"]
+            ctx, samples = _load_result(fname)
             rr = ctx.to_pandas_dict()
 
             for sample in samples:
@@ -33,11 +45,11 @@ def load_results(
 
     if isinstance(sources, str):
         # glob
-        pkl_paths: Iterable[str] = sorted(glob.glob(sources))
+        paths: Iterable[str] = sorted(glob.glob(sources))
     else:
-        pkl_paths = sources
+        paths = sources
 
-    xx = pd.DataFrame(list(_stream(pkl_paths)))
+    xx = pd.DataFrame(list(_stream(paths)))
     xx = xx.set_index("experiment")
     xx["submit"] = xx.t1 - xx.t0
     xx["elapsed"] = xx.t2 - xx.t0
@@ -1,16 +1,16 @@
 """Utilities for benchmarking."""
 
+from __future__ import annotations
+
 import importlib
 import json
-import pickle
 from copy import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from time import sleep
 from timeit import default_timer as t_now
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import affine
-import distributed
 import numpy as np
 import pystac.item
 import xarray as xr
@@ -21,6 +21,9 @@ from odc.geo.xr import ODCExtension
 
 import odc.stac
 
+if TYPE_CHECKING:
+    import distributed
+
 TimeSample = Tuple[float, float, float]
 """(t0, t_finished_submit, t_finished_compute)"""
 
@@ -162,6 +165,21 @@ class BenchmarkContext:
         sx, _, _, _, sy, *_ = self.transform
         return min(abs(v) for v in [sx, sy])
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to JSON compatible dictionary."""
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        data["transform"] = list(self.transform)[:6]
+        return data
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "BenchmarkContext":
+        """Construct from output of :py:meth:`to_dict`."""
+        data = dict(data)
+        data["transform"] = affine.Affine(*data["transform"][:6])
+        for k in ("shape", "chunks"):
+            data[k] = tuple(data[k])
+        return BenchmarkContext(**data)
+
     def to_pandas_dict(self) -> Dict[str, Any]:
         """Extract parts one would need for analysis of results."""
         return dict(
@@ -438,12 +456,14 @@ def run_bench(
     :param ntimes: How many rounds to run (default: 1)
     :param col_width: First column width in characters
     :param restart_sleep: Number of seconds to sleep after ``client.restart()``
-    :param results_file: If set pickle results to this file, it will be overwritten
-                         after every run.
+    :param results_file: If set save results to this file in json format, it will be
+                         overwritten after every run.
     :returns: :class:`odc.stac.bench.BenchmarkContext` and timing info per run.
 
     Reported timing info is a triple of ``(t0, t_finished_submit, t_finished_persist)``
     """
+    import distributed  # deferred: slow to import, not needed until run time
+
     params = xx.attrs.get("load_params", None)
 
     extra = {}
@@ -452,6 +472,10 @@ def run_bench(
         extra["scenario"] = params.scenario
 
     bench_ctx = collect_context_info(client, xx, **extra)
+    ctx_doc = bench_ctx.to_dict()
+    if results_file is not None:
+        # fail before running anything if context can't be saved
+        _ = json.dumps(ctx_doc)
     samples = []
     _xx = None
 
@@ -475,8 +499,9 @@ def run_bench(
             samples.append(times)
 
             if results_file is not None:
-                with open(results_file, "wb") as dst:
-                    pickle.dump({"context": bench_ctx, "samples": samples}, dst)
+                doc = json.dumps({"context": ctx_doc, "samples": samples})
+                with open(results_file, "wt", encoding="utf8") as dst:
+                    dst.write(doc)
     except KeyboardInterrupt:
         print("Aborting early upon request")
         if _xx is not None:
@@ -23,7 +23,6 @@ except ImportError:
 from datacube.model import Dataset, DatasetType, metadata_from_doc
 from odc.geo import CRS
 from odc.geo.geobox import GeoBox
-from toolz import dicttoolz
 
 from .._mdtools import (
     EPSG4326,
@@ -55,6 +54,8 @@ STAC_TO_EO3_RENAMES = {
     "view:sun_elevation": "eo:sun_elevation",
 }
 
+EO3_DATASET_SCHEMA = "https://schemas.opendatacube.org/dataset"
+
 (_eo3,) = (
     metadata_from_doc(d) for d in default_metadata_type_docs() if d.get("name") == "eo3"
 )
@@ -125,17 +126,20 @@ def infer_dc_product_from_item(
 def _compute_uuid(
     item: pystac.item.Item, mode: str = "auto", extras: Optional[Sequence[str]] = None
 ) -> uuid.UUID:
+    item_id = item.id
     if mode == "native":
-        return uuid.UUID(item.id)
+        return uuid.UUID(item_id)
     if mode == "random":
         return uuid.uuid4()
 
     assert mode == "auto"
-    # 1. see if .id is already a UUID
-    try:
-        return uuid.UUID(item.id)
-    except ValueError:
-        pass
+    # 1. see if .id is already a UUID, shorter ids can't be, so don't bother
+    #    raising and catching an exception for those (common case)
+    if len(item_id) >= 32:
+        try:
+            return uuid.UUID(item_id)
+        except ValueError:
+            pass
 
     # 2. .collection_id, .id, [extras]
     #
@@ -148,10 +152,10 @@ def _compute_uuid(
     #  At a minimum it's just 2 lines collection_id and item.id If extra keys are requested, these
     #  are sorted first and then appended one per line in `{key}={value}` format where value is
     #  looked up from item properties, if key is missing then {value} is set to empty string.
-    hash_srcs = [_collection_id(item), item.id]
-    if extras is not None:
-        tags = [f"{k}={str(item.properties.get(k, ''))}" for k in sorted(extras)]
-        hash_srcs.extend(tags)
+    hash_srcs = [_collection_id(item), item_id]
+    if extras:
+        props = item.properties
+        hash_srcs.extend(f"{k}={props.get(k, '')}" for k in sorted(extras))
     hash_text = "\n".join(hash_srcs) + "\n"  # < ensure last line ends on \n
     return uuid.uuid5(UUID_NAMESPACE_STAC, hash_text)
 
@@ -169,20 +173,19 @@ def _to_dataset(
     # pylint: disable=too-many-locals
 
     md = item.collection
+    has_proj = md.has_proj
     band2grid = md.band2grid
     grids: Dict[str, Dict[str, Any]] = {}
     measurements: Dict[str, Dict[str, Any]] = {}
     crs: Optional[CRS] = None
 
-    for band_key, src in item.bands.items():
-        name, idx = band_key
-
+    for (name, idx), src in item.bands.items():
         m: Dict[str, Any] = {"path": src.uri}
         if idx > 1:
             m["band"] = idx
         measurements[name] = m
 
-        if not md.has_proj:
+        if not has_proj:
             continue
 
         grid_name = band2grid.get(name, "default")
@@ -211,15 +214,14 @@ def _to_dataset(
     if crs is None:
         crs = EPSG4326
 
+    _rename = STAC_TO_EO3_RENAMES.get
     ds_doc = {
         "id": str(ds_uuid),
-        "$schema": "https://schemas.opendatacube.org/dataset",
+        "$schema": EO3_DATASET_SCHEMA,
         "crs": str(crs),
         "grids": grids,
         "measurements": measurements,
-        "properties": dicttoolz.keymap(
-            lambda k: STAC_TO_EO3_RENAMES.get(k, k), properties
-        ),
+        "properties": {_rename(k, k): v for k, v in properties.items()},
         "lineage": {},
     }
 
@@ -6,6 +6,7 @@ import datetime as dt
 import math
 from copy import copy
 from dataclasses import astuple, dataclass, field, replace
+from functools import lru_cache
 from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
 from odc.geo import CRS, Geometry, MaybeCRS
@@ -274,6 +275,8 @@ class ParsedItem(Mapping[BandIdentifier, RasterSource]):
             if gbox.crs is not None:
                 if crs is None or crs == gbox.crs:
                     return gbox.extent
+                if isinstance(crs, CRS):
+                    return _gbox_footprint(gbox, crs)
                 return gbox.footprint(crs)
 
         return None
@@ -297,7 +300,7 @@ class ParsedItem(Mapping[BandIdentifier, RasterSource]):
         if self.geometry is None:
             return None
 
-        if crs is None or isinstance(crs, Unset):
+        if crs is None or isinstance(crs, Unset) or crs == self.geometry.crs:
             return self.geometry
 
         N = 100  # minimum number of points along perimiter we desire
@@ -485,6 +488,17 @@ def _norm_band_cfg(
     }
 
 
+@lru_cache(maxsize=1024)
+def _gbox_footprint(gbox: GeoBox, crs: CRS) -> Geometry:
+    """
+    Footprint of a grid in a given projection.
+
+    Items of a collection often share the same native grid (same tile, different dates), so we
+    only reproject that grid once per destination CRS and share the result.
+    """
+    return gbox.footprint(crs)
+
+
 def _convert_to_solar_time(utc: dt.datetime, longitude: float) -> dt.datetime:
     # offset_seconds snapped to 1 hour increments
     #    1/15 == 24/360 (hours per degree of longitude)
@@ -4,6 +4,10 @@ import pytest
 
 distributed = pytest.importorskip("distributed")
 
+import json
+import pickle
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import xarray
@@ -12,10 +16,16 @@ from odc.geo.xr import ODCExtension
 
 from odc.stac.bench import (
     BenchLoadParams,
+    BenchmarkContext,
     collect_context_info,
     load_from_json,
+    load_results,
     run_bench,
 )
+from odc.stac.bench._cli import _load_geojson
+from odc.stac.bench._report import _load_result
+
+SITE1 = Path(__file__).parent / "data" / "site1-20200606-tall-strip-africa.geojson"
 
 CFG = {
     "*": {
@@ -291,3 +301,68 @@ def test_bench_params_json():
     # function should round-trip too
     params.patch_url = load_from_json
     assert params == BenchLoadParams.from_json(params.to_json())
+
+
+def test_load_results(fake_dask_client, bench_site1, tmp_path):
+    params = BenchLoadParams(
+        scenario="test1",
+        method="odc-stac",
+        bands=("red", "green", "blue"),
+        chunks=(2048, 2048),
+        extra={"odc-stac": {"groupby": "solar_day", "stac_cfg": CFG}},
+    )
+    xx = load_from_json(bench_site1, params)
+
+    results = []
+    for i, ntimes in enumerate([3, 2]):
+        results_file = str(tmp_path / f"run{i}.json")
+        rr, timing = run_bench(xx, fake_dask_client, ntimes, results_file=results_file)
+        results.append(results_file)
+
+    _rr = BenchmarkContext.from_dict(rr.to_dict())
+    assert _rr == rr
+    assert _rr.method == rr.method
+    assert _rr.nthreads == rr.nthreads
+
+    _ctx, samples = _load_result(results[-1])
+    assert _ctx == rr
+    assert samples == timing
+
+    df = load_results(results)
+    assert df.shape[0] == 5
+    assert list(df.index) == [0, 0, 0, 1, 1]
+    assert (df.scenario == rr.scenario).all()
+    assert (df.npix == rr.npix).all()
+    assert (df.elapsed >= df.submit).all()
+
+    df_glob = load_results(str(tmp_path / "*.json"))
+    assert df_glob.equals(df)
+
+    # results saved by older versions
+    with open(tmp_path / "legacy.pkl", "wb") as dst:
+        pickle.dump({"context": rr, "samples": timing}, dst)
+
+    df = load_results([str(tmp_path / "legacy.pkl"), *results])
+    assert list(df.index) == [0, 0, 1, 1, 1, 2, 2]
+    assert (df.npix == rr.npix).all()
+
+    # values that can't be stored in json should fail on write
+    fake_dask_client.scheduler_info.return_value["not-json"] = {1, 2}
+    fake_dask_client.restart.reset_mock()
+    with pytest.raises(TypeError):
+        run_bench(xx, fake_dask_client, 1, results_file=str(tmp_path / "bad.json"))
+    fake_dask_client.restart.assert_not_called()
+    assert not (tmp_path / "bad.json").exists()
+
+
+def test_load_geojson(monkeypatch):
+    with SITE1.open("rt", encoding="utf8") as src:
+        expect = json.load(src)
+
+    # fallback to json when orjson is not installed
+    with monkeypatch.context() as m:
+        m.setitem(sys.modules, "orjson", None)
+        assert _load_geojson(str(SITE1)) == expect
+
+    pytest.importorskip("orjson")
+    assert _load_geojson(str(SITE1)) == expect
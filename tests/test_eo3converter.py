@@ -186,6 +186,9 @@ def test_item_uuid():
     _id = uuid.uuid4()
     assert _compute_uuid(mk_stac_item(str(_id)), "native") == _id
     assert _compute_uuid(mk_stac_item(str(_id)), "auto") == _id
+    assert _compute_uuid(mk_stac_item(_id.hex), "auto") == _id
+    assert _compute_uuid(mk_stac_item(_id.urn), "auto") == _id
+    assert _compute_uuid(mk_stac_item(_id.hex[:31]), "auto").version == 5
 
     # Check that extras are used
     id1 = _compute_uuid(item1, extras=["custom_property", "missing_property"])
@@ -195,6 +198,11 @@ def test_item_uuid():
     assert id2.version == 5
     assert id1 != id2
 
+    # Check deterministic UUIDs are stable across releases
+    assert id1 == uuid.UUID("c6e90ea9-0e54-51c1-b881-f18a74395416")
+    assert id2 == uuid.UUID("8e958a63-b6e3-52d4-bc42-98a1a1c60154")
+    assert _compute_uuid(item1, extras=[]) == id2
+
 
 def test_issue_n6(usgs_landsat_stac_v1):
     expected_bands = {
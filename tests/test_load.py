@@ -1,18 +1,21 @@
 # pylint: disable=missing-module-docstring,redefined-builtin
+from dataclasses import replace
 from unittest.mock import MagicMock
 
 import pystac
 import pystac.item
 import pytest
 import shapely.geometry
+from affine import Affine
 from dask.utils import ndeepmap
-from odc.geo.geobox import GeoBox
+from odc.geo.geobox import GeoBox, GeoboxTiles
+from odc.geo.geom import box
 from odc.geo.xr import ODCExtension
 
 from odc.loader import resolve_load_cfg
 from odc.stac import RasterLoadParams
 from odc.stac import load as stac_load
-from odc.stac._stac_load import _group_items
+from odc.stac._stac_load import _group_items, _tyx_bins
 from odc.stac.testing.stac import b_, mk_parsed_item, to_stac_item
 
 
@@ -209,6 +212,52 @@ def test_group_items():
         preserve_original_order=True,
     )
 
+    # group key is computed once per item
+    group_key = MagicMock(side_effect=lambda item, parsed, idx: idx % 2)
+    _t([aa, b1, b2, cc], group_key, [[aa, b2], [cc, b1]])
+    assert group_key.call_count == 4
+
+
+def test_tyx_bins():
+    gbox = GeoBox.from_bbox((10, 0, 10.2, 1), shape=(100, 100))
+    gbox2 = GeoBox.from_bbox((10.1, 0, 10.25, 1), shape=(100, 75))
+    items = [
+        mk_parsed_item([b_("b1", gbox)], datetime="2020-01-02T00:01Z", id="a"),
+        mk_parsed_item([b_("b1", gbox)], datetime="2020-01-03T00:01Z", id="b"),
+        mk_parsed_item([b_("b1", gbox2)], datetime="2020-01-03T00:01Z", id="c"),
+    ]
+    out = GeoBox.from_bbox((10, 0, 10.4, 1), shape=(100, 200))
+    gbt = GeoboxTiles(out, (100, 50))
+
+    bins = dict(_tyx_bins([[0], [1, 2]], items, gbt))
+    assert bins == {
+        (0, 0, 0): [0],
+        (0, 0, 1): [0],
+        (1, 0, 0): [1],
+        (1, 0, 1): [1, 2],
+        (1, 0, 2): [2],
+    }
+
+    # grid without CRS: footprint comes from item geometry, not shared
+    gbox = GeoBox((100, 100), Affine(0.002, 0, 10, 0, -0.01, 1), None)
+    items = [
+        replace(
+            mk_parsed_item([b_("b1", gbox)], datetime="2020-01-02T00:01Z", id=_id),
+            geometry=geom,
+        )
+        for _id, geom in [
+            ("a", box(10, 0, 10.2, 1, "epsg:4326")),
+            ("b", box(10.3, 0, 10.4, 1, "epsg:4326")),
+        ]
+    ]
+    bins = dict(_tyx_bins([[0], [1]], items, gbt))
+    assert bins == {
+        (0, 0, 0): [0],
+        (0, 0, 1): [0],
+        (1, 0, 2): [1],
+        (1, 0, 3): [1],
+    }
+
 
 def test_resolve_load_cfg():
     rlp = RasterLoadParams
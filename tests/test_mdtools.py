@@ -19,6 +19,7 @@ from odc.loader.types import FixedCoord, RasterBandMetadata, RasterGroupMetadata
 from odc.stac._mdtools import (
     MDParseConfig,
     _auto_load_params,
+    _group_geoboxes,
     _most_common_gbox,
     _normalize_geometry,
     asset_geobox,
@@ -108,6 +109,21 @@ def test_eo3_grids(sentinel_stac_ms: pystac.item.Item):
     assert crs.epsg == 3857
 
 
+def test_group_geoboxes_default():
+    g10 = GeoBox.from_bbox((0, 0, 100, 100), "epsg:3857", resolution=10)
+    g20 = GeoBox.from_bbox((0, 0, 100, 100), "epsg:3857", resolution=20)
+
+    # most bands wins
+    grids, b2g = _group_geoboxes({"a": g20, "b": g10, "c": g20})
+    assert grids == {"default": g20, "g10": g10}
+    assert b2g == {"a": "default", "b": "g10", "c": "default"}
+
+    # on a tie smaller pixel wins
+    grids, b2g = _group_geoboxes({"a": g20, "b": g10})
+    assert grids == {"g20": g20, "default": g10}
+    assert b2g == {"a": "g20", "b": "default"}
+
+
 def test_asset_geobox(sentinel_stac: pystac.item.Item):
     item0 = sentinel_stac
     item = item0.clone()
@@ -172,6 +188,11 @@ def test_is_raster_data_more():
     assert is_raster_data(_a(media_type="image/jpeg", roles=["data"])) is True
     assert is_raster_data(_a(media_type="image/jpeg", roles=["overview"])) is False
     assert is_raster_data(_a(media_type="image/jpeg", roles=["thumbnail"])) is False
+    cog = "image/tiff; application=geotiff; profile=cloud-optimized"
+    assert is_raster_data(_a(media_type=cog)) is True
+    assert is_raster_data(_a(media_type=cog, roles=["data", "overview"])) is False
+    assert is_raster_data(_a(media_type="Application/X-HDF5")) is True
+    assert is_raster_data(_a(media_type="application/json")) is False
 
     # no media type defined
     assert is_raster_data(_a(roles=["data"])) is True
@@ -185,6 +206,10 @@ def test_is_raster_data_more():
     assert is_raster_data(_a(href="/foo.TIFF")) is True
     assert is_raster_data(_a(href="/foo.jpeg")) is True
     assert is_raster_data(_a(href="/foo.jpg")) is True
+    assert is_raster_data(_a(href="https://example.com/foo.tif?sig=a.b")) is True
+    assert is_raster_data(_a(href="https://example.com/foo.json?f=a.tif")) is False
+    assert is_raster_data(_a(href="/data/scene#1.tif")) is True
+    assert is_raster_data(_a(href="scene 1?.tif")) is True
 
 
 def test_extract_md(sentinel_stac_ms: pystac.item.Item):
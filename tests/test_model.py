@@ -1,9 +1,12 @@
 # pylint: disable=redefined-outer-name,missing-module-docstring,missing-function-docstring
 import datetime as dt
+from dataclasses import replace
 
 import pytest
 from dask.base import tokenize
+from odc.geo import CRS
 from odc.geo.geobox import GeoBox
+from odc.geo.geom import box
 
 from odc.loader.types import (
     RasterBandMetadata,
@@ -206,3 +209,31 @@ def test_tokenize(parsed_item_ab: ParsedItem):
     assert tokenize(RasterLoadParams()) == tokenize(RasterLoadParams())
     assert tokenize(RasterLoadParams("uint8")) == tokenize(RasterLoadParams("uint8"))
     assert tokenize(RasterLoadParams("uint8")) != tokenize(RasterLoadParams("uint32"))
+
+
+def test_image_geometry_shared_grid():
+    gbox = GeoBox.from_bbox((10, 0, 10.2, 1), shape=(100, 100))
+    xx = mk_parsed_item([b_("b1", gbox)], datetime="2020-01-02T12:13:14Z")
+    yy = mk_parsed_item([b_("b1", gbox)], datetime="2020-01-03T12:13:14Z")
+    utm = CRS("epsg:32632")
+
+    assert xx.image_geometry() == gbox.extent
+    assert xx.image_geometry("epsg:4326") == gbox.extent
+    assert xx.image_geometry(utm) == gbox.footprint(utm)
+    # items on the same grid share reprojected footprint
+    assert xx.image_geometry(utm) is yy.image_geometry(utm)
+    assert xx.safe_geometry(utm) is yy.safe_geometry(utm)
+
+
+def test_safe_geometry_no_proj():
+    geom = box(10, 0, 10.2, 1, "epsg:4326")
+    xx = replace(mk_parsed_item([b_("b1", None)]), geometry=geom)
+    assert xx.image_geometry() is None
+
+    assert xx.safe_geometry() is geom
+    assert xx.safe_geometry("epsg:4326") is geom
+    assert xx.safe_geometry(CRS("epsg:4326")) is geom
+
+    g = xx.safe_geometry("epsg:32632")
+    assert g is not None
+    assert g.crs == "epsg:32632"